@@ -5,19 +5,31 @@ Arrow IPC client for PL-GRIZZLY daemon
 
 import socket
 import pyarrow as pa
-import io
+
+# Request schema is fixed, so build it once per process
+REQUEST_SCHEMA = pa.schema([
+    ("command", pa.string()),
+    ("query", pa.string())
+])
 
 def create_request_batch(command, query=""):
     """Create an Arrow record batch for the request."""
-    schema = pa.schema([
-        ("command", pa.string()),
-        ("query", pa.string())
-    ])
-
     command_array = pa.array([command], type=pa.string())
     query_array = pa.array([query], type=pa.string())
 
-    return pa.RecordBatch.from_arrays([command_array, query_array], schema=schema)
+    return pa.RecordBatch.from_arrays([command_array, query_array], schema=REQUEST_SCHEMA)
+
+def recv_all(client, chunk_size=65536):
+    """Read from the socket until the peer closes the connection."""
+    buf = bytearray()
+    chunk = bytearray(chunk_size)
+    view = memoryview(chunk)
+    while True:
+        n = client.recv_into(view)
+        if n == 0:
+            break
+        buf += view[:n]
+    return buf
 
 def send_request(socket_path, command, query=""):
     """Send a request to the daemon and receive response."""
@@ -25,27 +37,27 @@ def send_request(socket_path, command, query=""):
     request_batch = create_request_batch(command, query)
 
     # Serialize request to Arrow IPC stream
-    output_stream = io.BytesIO()
-    writer = pa.ipc.new_stream(output_stream, request_batch.schema)
+    sink = pa.BufferOutputStream()
+    writer = pa.ipc.new_stream(sink, REQUEST_SCHEMA)
     writer.write_batch(request_batch)
     writer.close()
 
-    request_data = output_stream.getvalue()
+    # pa.Buffer exposes the buffer protocol, so sendall needs no copy
+    request_data = sink.getvalue()
 
     # Connect to daemon
-    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    client.connect(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
 
-    # Send request
-    client.sendall(request_data)
+        # Send request and signal end of request
+        client.sendall(request_data)
+        client.shutdown(socket.SHUT_WR)
 
-    # Receive response
-    response_data = client.recv(4096)
-    client.close()
+        # Receive response; the daemon closes the connection once sent
+        response_data = recv_all(client)
 
-    # Deserialize response from Arrow IPC stream
-    input_stream = pa.input_stream(io.BytesIO(response_data))
-    reader = pa.ipc.open_stream(input_stream)
+    # Deserialize response from Arrow IPC stream without an extra copy
+    reader = pa.ipc.open_stream(pa.BufferReader(pa.py_buffer(response_data)))
     response_batch = reader.read_next_batch()
 
     # Extract response fields
@@ -1,41 +1,37 @@
 import asyncio
+import os
 import uvloop
 import time
 from typing import List, Any
 
-# Install uvloop as the event loop
-asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+# Per-task progress output is only printed when MOJO_ASYNC_DEBUG is set
+_log = print if os.environ.get("MOJO_ASYNC_DEBUG") else (lambda *args, **kwargs: None)
 
 # Simple channel implementation using asyncio.Queue
-class Channel:
-    def __init__(self):
-        self.queue = asyncio.Queue()
-
-    async def send(self, item):
-        await self.queue.put(item)
-
-    async def receive(self):
-        return await self.queue.get()
+class Channel(asyncio.Queue):
+    # Alias the queue methods so send/receive add no extra coroutine frame
+    send = asyncio.Queue.put
+    receive = asyncio.Queue.get
 
 async def producer(channel: Channel, name: str, items: List[int]):
     """Producer that sends items to a channel"""
-    print(f"Producer {name} starting...")
+    _log(f"Producer {name} starting...")
     for item in items:
-        print(f"Producer {name} sending: {item}")
+        _log(f"Producer {name} sending: {item}")
         await channel.send(item)
         await asyncio.sleep(0.1)  # Simulate work
-    print(f"Producer {name} finished")
+    _log(f"Producer {name} finished")
 
 async def consumer(channel: Channel, name: str, num_items: int):
     """Consumer that receives items from a channel"""
-    print(f"Consumer {name} starting...")
+    _log(f"Consumer {name} starting...")
     results = []
     for _ in range(num_items):
         item = await channel.receive()
-        print(f"Consumer {name} received: {item}")
+        _log(f"Consumer {name} received: {item}")
         results.append(item * 2)  # Process item
         await asyncio.sleep(0.05)  # Simulate processing time
-    print(f"Consumer {name} finished with results: {results}")
+    _log(f"Consumer {name} finished with results: {results}")
     return results
 
 async def channel_example():
@@ -43,36 +39,34 @@ async def channel_example():
     print("Channel Example: Producer-Consumer Pattern")
     channel = Channel()
 
-    # Start producer and consumer concurrently
-    producer_task = producer(channel, "P1", [1, 2, 3, 4, 5])
-    consumer_task = consumer(channel, "C1", 5)
-
-    # Wait for both to complete
-    await asyncio.gather(producer_task, consumer_task)
+    # Start producer and consumer concurrently; the group waits for both
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(producer(channel, "P1", [1, 2, 3, 4, 5]))
+        tg.create_task(consumer(channel, "C1", 5))
     print("Channel example completed")
 
-# Task group simulation using asyncio.gather
+# Task groups using asyncio.TaskGroup
 async def task_in_group(name: str, delay: float) -> str:
     """A task that runs as part of a group"""
-    print(f"Task {name} starting...")
+    _log(f"Task {name} starting...")
     await asyncio.sleep(delay)
-    print(f"Task {name} completed")
+    _log(f"Task {name} completed")
     return f"Task {name} result"
 
 async def task_group_example():
     """Demonstrate structured concurrency with task groups"""
     print("Task Group Example: Structured Concurrency")
 
-    # Create a group of tasks
-    tasks = [
-        task_in_group("A", 0.3),
-        task_in_group("B", 0.2),
-        task_in_group("C", 0.4),
-        task_in_group("D", 0.1)
-    ]
+    # Run a group of tasks concurrently; leaving the block waits for completion
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(task_in_group("A", 0.3)),
+            tg.create_task(task_in_group("B", 0.2)),
+            tg.create_task(task_in_group("C", 0.4)),
+            tg.create_task(task_in_group("D", 0.1))
+        ]
 
-    # Run all tasks concurrently and wait for completion
-    results = await asyncio.gather(*tasks)
+    results = [task.result() for task in tasks]
 
     print("All tasks in group completed:")
     for result in results:
@@ -83,34 +77,36 @@ async def task_group_example():
 # Nested task groups
 async def nested_task(name: str, value: int) -> int:
     """A nested task"""
-    print(f"Nested task {name} processing {value}")
+    _log(f"Nested task {name} processing {value}")
     await asyncio.sleep(0.1)
     return value * 10
 
 async def outer_task(name: str) -> List[int]:
     """Outer task that spawns nested tasks"""
-    print(f"Outer task {name} starting...")
+    _log(f"Outer task {name} starting...")
 
-    nested_tasks = [
-        nested_task(f"{name}-1", 1),
-        nested_task(f"{name}-2", 2),
-        nested_task(f"{name}-3", 3)
-    ]
+    async with asyncio.TaskGroup() as tg:
+        nested_tasks = [
+            tg.create_task(nested_task(f"{name}-1", 1)),
+            tg.create_task(nested_task(f"{name}-2", 2)),
+            tg.create_task(nested_task(f"{name}-3", 3))
+        ]
 
-    results = await asyncio.gather(*nested_tasks)
-    print(f"Outer task {name} completed with results: {results}")
+    results = [task.result() for task in nested_tasks]
+    _log(f"Outer task {name} completed with results: {results}")
     return results
 
 async def nested_groups_example():
     """Demonstrate nested task groups"""
     print("Nested Task Groups Example")
 
-    outer_tasks = [
-        outer_task("Group1"),
-        outer_task("Group2")
-    ]
+    async with asyncio.TaskGroup() as tg:
+        outer_tasks = [
+            tg.create_task(outer_task("Group1")),
+            tg.create_task(outer_task("Group2"))
+        ]
 
-    all_results = await asyncio.gather(*outer_tasks)
+    all_results = [task.result() for task in outer_tasks]
 
     print("All nested groups completed:")
     for i, results in enumerate(all_results):
@@ -120,12 +116,12 @@ async def nested_groups_example():
 async def cancellable_task(name: str, duration: float):
     """A task that can be cancelled"""
     try:
-        print(f"Task {name} starting (will run for {duration}s)...")
+        _log(f"Task {name} starting (will run for {duration}s)...")
         await asyncio.sleep(duration)
-        print(f"Task {name} completed normally")
+        _log(f"Task {name} completed normally")
         return f"{name} success"
     except asyncio.CancelledError:
-        print(f"Task {name} was cancelled!")
+        _log(f"Task {name} was cancelled!")
         raise
 
 async def cancellation_example():
@@ -162,16 +158,16 @@ async def cancellation_example():
 
 def run_channel_example():
     """Run the channel example"""
-    asyncio.run(channel_example())
+    uvloop.run(channel_example())
 
 def run_task_group_example():
     """Run the task group example"""
-    asyncio.run(task_group_example())
+    uvloop.run(task_group_example())
 
 def run_nested_groups_example():
     """Run the nested groups example"""
-    asyncio.run(nested_groups_example())
+    uvloop.run(nested_groups_example())
 
 def run_cancellation_example():
     """Run the cancellation example"""
-    asyncio.run(cancellation_example())
\ No newline at end of file
+    uvloop.run(cancellation_example())
\ No newline at end of file
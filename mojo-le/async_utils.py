@@ -1,13 +1,18 @@
 import asyncio
+import os
 import time
+import uvloop
 
-# Note: uvloop event loop is created directly in Mojo code
+# Per-task progress output is only printed when MOJO_ASYNC_DEBUG is set
+_log = print if os.environ.get("MOJO_ASYNC_DEBUG") else (lambda *args, **kwargs: None)
+
+# Every run_* entry point drives its example on a fresh uvloop event loop
 
 async def simple_async_task(name: str, delay: float) -> str:
     """A simple async task that simulates work with a delay"""
-    print(f"Starting task: {name}")
+    _log(f"Starting task: {name}")
     await asyncio.sleep(delay)  # Async delay
-    print(f"Completed task: {name}")
+    _log(f"Completed task: {name}")
     return name + " done"
 
 async def compute_async(value: int) -> int:
@@ -20,13 +25,13 @@ async def concurrent_example():
     """Demonstrate running multiple async tasks concurrently"""
     print("Starting concurrent tasks...")
 
-    # Create async tasks
-    task1 = simple_async_task("Task A", 0.5)
-    task2 = simple_async_task("Task B", 0.3)
-    task3 = compute_async(5)
+    # Create async tasks in a task group for true concurrent execution
+    async with asyncio.TaskGroup() as tg:
+        task1 = tg.create_task(simple_async_task("Task A", 0.5))
+        task2 = tg.create_task(simple_async_task("Task B", 0.3))
+        task3 = tg.create_task(compute_async(5))
 
-    # Use gather for true concurrent execution
-    results = await asyncio.gather(task1, task2, task3)
+    results = [task1.result(), task2.result(), task3.result()]
 
     print("All tasks completed:")
     for i, result in enumerate(results, 1):
@@ -75,74 +80,69 @@ async def error_handling_example():
 
 def run_concurrent_example():
     """Run the concurrent example"""
-    asyncio.run(concurrent_example())
+    uvloop.run(concurrent_example())
 
 def run_multiple_awaits_example():
     """Run the multiple awaits example"""
-    asyncio.run(multiple_awaits_example())
+    uvloop.run(multiple_awaits_example())
 
 def run_error_handling_example():
     """Run the error handling example"""
-    asyncio.run(error_handling_example())
+    uvloop.run(error_handling_example())
 
 # Advanced async examples
 
-class Channel:
-    def __init__(self):
-        self.queue = asyncio.Queue()
-
-    async def send(self, item):
-        await self.queue.put(item)
-
-    async def receive(self):
-        return await self.queue.get()
+class Channel(asyncio.Queue):
+    # Alias the queue methods so send/receive add no extra coroutine frame
+    send = asyncio.Queue.put
+    receive = asyncio.Queue.get
 
 async def producer(channel, name, items):
-    print("Producer", name, "starting...")
+    _log("Producer", name, "starting...")
     for item in items:
-        print("Producer", name, "sending:", item)
+        _log("Producer", name, "sending:", item)
         await channel.send(item)
         await asyncio.sleep(0.1)
-    print("Producer", name, "finished")
+    _log("Producer", name, "finished")
 
 async def consumer(channel, name, num_items):
-    print("Consumer", name, "starting...")
+    _log("Consumer", name, "starting...")
     results = []
     for _ in range(num_items):
         item = await channel.receive()
-        print("Consumer", name, "received:", item)
+        _log("Consumer", name, "received:", item)
         results.append(item * 2)
         await asyncio.sleep(0.05)
-    print("Consumer", name, "finished with results:", results)
+    _log("Consumer", name, "finished with results:", results)
     return results
 
 async def channel_example():
     print("Channel Example: Producer-Consumer Pattern")
     channel = Channel()
 
-    producer_task = producer(channel, "P1", [1, 2, 3, 4, 5])
-    consumer_task = consumer(channel, "C1", 5)
-
-    await asyncio.gather(producer_task, consumer_task)
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(producer(channel, "P1", [1, 2, 3, 4, 5]))
+        tg.create_task(consumer(channel, "C1", 5))
     print("Channel example completed")
 
 async def task_in_group(name, delay):
-    print("Task", name, "starting...")
+    _log("Task", name, "starting...")
     await asyncio.sleep(delay)
-    print("Task", name, "completed")
+    _log("Task", name, "completed")
     return "Task " + name + " result"
 
 async def task_group_example():
     print("Task Group Example: Structured Concurrency")
 
-    tasks = [
-        task_in_group("A", 0.3),
-        task_in_group("B", 0.2),
-        task_in_group("C", 0.4),
-        task_in_group("D", 0.1)
-    ]
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(task_in_group("A", 0.3)),
+            tg.create_task(task_in_group("B", 0.2)),
+            tg.create_task(task_in_group("C", 0.4)),
+            tg.create_task(task_in_group("D", 0.1))
+        ]
 
-    results = await asyncio.gather(*tasks)
+    results = [task.result() for task in tasks]
 
     print("All tasks in group completed:")
     for result in results:
@@ -152,12 +152,12 @@ async def task_group_example():
 
 async def cancellable_task(name, duration):
     try:
-        print("Task", name, "starting (will run for", duration, "s)...")
+        _log("Task", name, "starting (will run for", duration, "s)...")
         await asyncio.sleep(duration)
-        print("Task", name, "completed normally")
+        _log("Task", name, "completed normally")
         return name + " success"
     except asyncio.CancelledError:
-        print("Task", name, "was cancelled!")
+        _log("Task", name, "was cancelled!")
         raise
 
 async def cancellation_example():
@@ -186,24 +186,28 @@ async def cancellation_example():
 
 def run_channel_example():
     """Run the channel example"""
-    asyncio.run(channel_example())
+    uvloop.run(channel_example())
 
 def run_task_group_example():
     """Run the task group example"""
-    asyncio.run(task_group_example())
+    uvloop.run(task_group_example())
 
 def run_cancellation_example():
     """Run the cancellation example"""
-    asyncio.run(cancellation_example())
+    uvloop.run(cancellation_example())
 
 # Expert async examples
 
 class AsyncRange:
+    # Hand control back to the event loop once per this many items
+    yield_every = 64
+
     def __init__(self, start, end, step=1):
         self.start = start
         self.end = end
         self.step = step
         self.current = start
+        self.count = 0
 
     def __aiter__(self):
         return self
@@ -213,7 +217,9 @@ class AsyncRange:
             raise StopAsyncIteration
         value = self.current
         self.current += self.step
-        await asyncio.sleep(0.01)
+        self.count += 1
+        if self.count % self.yield_every == 0:
+            await asyncio.sleep(0)
         return value
 
 async def async_range_example():
@@ -222,66 +228,41 @@ async def async_range_example():
         print("Got from async iterator:", i)
     print("Async iterator completed")
 
-class Semaphore:
-    def __init__(self, value=1):
-        self.value = value
-        self.waiters = []
-
-    async def acquire(self):
-        if self.value > 0:
-            self.value -= 1
-            return True
-        else:
-            future = asyncio.Future()
-            self.waiters.append(future)
-            await future
-            return True
-
-    def release(self):
-        self.value += 1
-        if self.waiters:
-            waiter = self.waiters.pop(0)
-            waiter.set_result(True)
-
 async def semaphore_task(name, semaphore):
-    print("Task", name, "waiting for semaphore...")
-    await semaphore.acquire()
-    print("Task", name, "acquired semaphore")
-    await asyncio.sleep(0.2)
-    print("Task", name, "releasing semaphore")
-    semaphore.release()
+    _log("Task", name, "waiting for semaphore...")
+    async with semaphore:
+        _log("Task", name, "acquired semaphore")
+        await asyncio.sleep(0.2)
+        _log("Task", name, "releasing semaphore")
 
 async def semaphore_example():
-    print("Custom Semaphore Example:")
-    semaphore = Semaphore(2)
+    print("Semaphore Example:")
+    semaphore = asyncio.Semaphore(2)
 
-    tasks = [
-        semaphore_task("A", semaphore),
-        semaphore_task("B", semaphore),
-        semaphore_task("C", semaphore),
-        semaphore_task("D", semaphore)
-    ]
-
-    await asyncio.gather(*tasks)
+    async with asyncio.TaskGroup() as tg:
+        for name in ("A", "B", "C", "D"):
+            tg.create_task(semaphore_task(name, semaphore))
     print("Semaphore example completed")
 
 async def performance_comparison():
     print("Performance Comparison: Sync vs Async with uvloop")
 
     iterations = 100
+    clock = time.perf_counter_ns
+    sleep = time.sleep
+    async_sleep = asyncio.sleep
 
     # Sync operation
-    start = time.time()
+    start = clock()
     for i in range(iterations):
-        time.sleep(0.001)
-    sync_time = time.time() - start
+        sleep(0.001)
+    sync_time = (clock() - start) / 1e9
     print("Sync time:", sync_time)
 
-    # Async operation
-    start = time.time()
-    for i in range(iterations):
-        await asyncio.sleep(0.001)
-    async_time = time.time() - start
+    # Async operation: the sleeps overlap on the event loop
+    start = clock()
+    await asyncio.gather(*[async_sleep(0.001) for _ in range(iterations)])
+    async_time = (clock() - start) / 1e9
     print("Async time:", async_time)
 
     if async_time < sync_time:
@@ -293,12 +274,12 @@ async def performance_comparison():
 
 def run_async_iterator_example():
     """Run the async iterator example"""
-    asyncio.run(async_range_example())
+    uvloop.run(async_range_example())
 
 def run_semaphore_example():
     """Run the semaphore example"""
-    asyncio.run(semaphore_example())
+    uvloop.run(semaphore_example())
 
 def run_performance_comparison():
     """Run the performance comparison"""
-    asyncio.run(performance_comparison())
\ No newline at end of file
+    uvloop.run(performance_comparison())
\ No newline at end of file